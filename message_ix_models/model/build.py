@@ -146,9 +146,14 @@ def apply_spec(  # noqa: C901
         N_removed = sum(len(d) for d in dump.values())
         log.info(f"{N_removed} total rows removed")
 
-    # Add units to the Platform before adding data
+    # Add units to the Platform before adding data. Specs merged from several sources
+    # (e.g. MESSAGEix-Materials) may contain duplicates; add each unit only once.
+    units_added: set[str] = set()
     for unit in spec["add"].set["unit"]:
         unit = unit if isinstance(unit, Code) else Code(id=unit, name=unit)
+        if unit.id in units_added:
+            continue
+        units_added.add(unit.id)
         _add_unit(scenario.platform, unit.id, str(unit.name))
 
     # Add data
@@ -72,18 +72,18 @@ def get_spec(
         filter(lambda a: a.id not in ("input", "output"), template.annotations)
     )
 
+    # "input" and "output" annotations in the template
+    input_tpl = template.eval_annotation(id="input")
+    output_tpl = template.eval_annotation(id="output")
+
     # Add conversion technologies
     for t, g in product(technologies, groups):
         # String formatting arguments
         fmt = dict(technology=t, group=g)
 
         # Format each field in the "input" and "output" annotations
-        input = {
-            k: v.format(**fmt) for k, v in template.eval_annotation(id="input").items()
-        }
-        output = {
-            k: v.format(**fmt) for k, v in template.eval_annotation(id="output").items()
-        }
+        input = {k: v.format(**fmt) for k, v in input_tpl.items()}
+        output = {k: v.format(**fmt) for k, v in output_tpl.items()}
 
         # - Format the ID string from the template
         # - Create new "input" and "output" annotations
@@ -191,8 +191,9 @@ def get_spec() -> Mapping[str, ScenarioInfo]:
     context = read_config()
 
     # Update the ScenarioInfo objects with required and new set elements
+    material = context["material"]
     for type in SPEC_LIST:
-        for set_name, config in context["material"][type].items():
+        for set_name, config in material[type].items():
             # for cat_name, detail in config.items():
             # Required elements
             require.set[set_name].extend(config.get("require", []))
@@ -230,21 +231,23 @@ def make_spec(regions: str, materials: str or None = SPEC_LIST) -> Spec:
 
     # Convert some values to codes
     for material in materials:
-        for set_name in sets[material]:
+        m_sets = sets[material]
+        for set_name in m_sets:
             if not all(
                 [
                     isinstance(item, list)
-                    for sublist in sets[material][set_name].values()
+                    for sublist in m_sets[set_name].values()
                     for item in sublist
                 ]
             ):
-                generate_set_elements(sets[material], set_name)
+                generate_set_elements(m_sets, set_name)
 
             # Elements to add, remove, and require
+            config = m_sets[set_name]
             for action in {"add", "remove", "require"}:
-                s[action].set[set_name].extend(sets[material][set_name].get(action, []))
+                s[action].set[set_name].extend(config.get(action, []))
             try:
-                s.add.set[f"{set_name} indexers"] = sets[material][set_name]["indexers"]
+                s.add.set[f"{set_name} indexers"] = config["indexers"]
             except KeyError:
                 pass
 
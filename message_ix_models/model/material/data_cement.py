@@ -167,7 +167,7 @@ def gen_data_cement(
     """Generate data for materials representation of cement industry."""
     # Load configuration
     context = read_config()
-    config = read_config()["material"]["cement"]
+    config = context["material"]["cement"]
     ssp = get_ssp_from_context(context)
     # Information about scenario, e.g. node, year
     s_info = ScenarioInfo(scenario)
@@ -1,5 +1,6 @@
 from ast import literal_eval
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 import yaml
@@ -39,33 +40,14 @@ def gen_data_methanol(scenario: "Scenario") -> dict[str, pd.DataFrame]:
     scenario: .Scenario
     """
     context = read_config()
-    df_pars = pd.read_excel(
-        message_ix_models.util.package_data_path(
-            "material", "methanol", "methanol_sensitivity_pars.xlsx"
-        ),
-        sheet_name="Sheet1",
-        dtype=object,
-    )
-    pars = df_pars.set_index("par").to_dict()["value"]
+    pars = read_sensitivity_pars()
     if pars["mtbe_scenario"] == "phase-out":
-        pars_dict = pd.read_excel(
-            message_ix_models.util.package_data_path(
-                "material", "methanol", "methanol_techno_economic.xlsx"
-            ),
-            sheet_name=None,
-            dtype=object,
-        )
+        fname = "methanol_techno_economic.xlsx"
     else:
-        pars_dict = pd.read_excel(
-            message_ix_models.util.package_data_path(
-                "material", "methanol", "methanol_techno_economic_high_demand.xlsx"
-            ),
-            sheet_name=None,
-            dtype=object,
-        )
+        fname = "methanol_techno_economic_high_demand.xlsx"
+    # Copy the cached data, so that it is not modified below or by the caller
+    pars_dict = {k: v.copy() for k, v in read_techno_economic(fname).items()}
 
-    for i in pars_dict.keys():
-        pars_dict[i] = unpivot_input_data(pars_dict[i], i)
     # TODO: only temporary hack to ensure SSP_dev compatibility
     if "SSP_dev" in scenario.model:
         file_path = message_ix_models.util.package_data_path(
@@ -91,6 +73,37 @@ def gen_data_methanol(scenario: "Scenario") -> dict[str, pd.DataFrame]:
     return pars_dict
 
 
+@lru_cache
+def read_sensitivity_pars() -> dict[str, Any]:
+    """Read the methanol sensitivity parameters.
+
+    The return value is cached for reuse.
+    """
+    df_pars = pd.read_excel(
+        message_ix_models.util.package_data_path(
+            "material", "methanol", "methanol_sensitivity_pars.xlsx"
+        ),
+        sheet_name="Sheet1",
+        dtype=object,
+    )
+    return df_pars.set_index("par").to_dict()["value"]
+
+
+@lru_cache
+def read_techno_economic(fname: str) -> dict[str, pd.DataFrame]:
+    """Read and unpivot methanol techno-economic data from the file `fname`.
+
+    The return value is cached for reuse, so that the workbook is read only once;
+    callers **must not** modify the returned data frames.
+    """
+    pars_dict = pd.read_excel(
+        message_ix_models.util.package_data_path("material", "methanol", fname),
+        sheet_name=None,
+        dtype=object,
+    )
+    return {k: unpivot_input_data(v, k) for k, v in pars_dict.items()}
+
+
 def broadcast_nodes(
     df_bc_node: pd.DataFrame,
     df_final: pd.DataFrame,
@@ -208,7 +221,7 @@ def unpivot_input_data(df: pd.DataFrame, par_name: str) -> pd.DataFrame:
         name of MESSAGEix parameter
     """
     df_final = df
-    df_final_full = pd.DataFrame()
+    dfs = []
 
     for i in df_final.index:
         # parse strings of node columns to dictionary
@@ -242,7 +255,10 @@ def unpivot_input_data(df: pd.DataFrame, par_name: str) -> pd.DataFrame:
             df_bc_node = broadcast_years(df_bc_node, yr_col_out, yr_cols_codes, col)
         df_bc_node[yr_col_out] = df_bc_node[yr_col_out].astype(int)
 
-        df_final_full = pd.concat([df_final_full, df_bc_node])
+        dfs.append(df_bc_node)
+
+    # Concatenate once, rather than re-allocating the full frame for every row
+    df_final_full = pd.concat(dfs) if dfs else pd.DataFrame()
     df_final_full = df_final_full.drop_duplicates().reset_index(drop=True)
 
     # special treatment for relation_activity dataframes:
@@ -7,7 +7,6 @@ import numpy as np
 import pandas as pd
 import yaml
 from message_ix import make_df
-from scipy.optimize import curve_fit
 
 import message_ix_models.util
 from message_ix_models import Context, ScenarioInfo
@@ -319,6 +318,8 @@ def derive_demand(
     scen: message_ix.Scenario,
     ssp: Literal["SSP1", "SSP2", "SSP3", "SSP4", "SSP5"] = "SSP2",
 ):
+    from scipy.optimize import curve_fit
+
     datapath = message_ix_models.util.package_data_path("material")
 
     # read pop projection from scenario
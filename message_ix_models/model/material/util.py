@@ -6,7 +6,6 @@ import message_ix
 import openpyxl as pxl
 import pandas as pd
 import yaml
-from scipy.optimize import curve_fit
 
 from message_ix_models import Context
 from message_ix_models.util import load_package_data, package_data_path
@@ -22,6 +21,10 @@ METADATA = [
 def read_config() -> Context:
     """Read configuration from set.yaml.
 
+    The file is parsed only on the first call. The contents are stored on the context,
+    and subsequent calls return the same context without re-reading the file, so
+    callers should treat the configuration as read-only.
+
     Returns
     -------
     message_ix_models.Context
@@ -228,6 +231,7 @@ def price_fit(df: pd.DataFrame) -> float:
     float
         estimated value for price_ref in 2020
     """
+    from scipy.optimize import curve_fit
 
     pars = curve_fit(exponential, df.year, df.lvl, maxfev=10000)[0]
     val = exponential([2020], *pars)[0]
@@ -249,6 +253,8 @@ def cost_fit(df: pd.DataFrame) -> float:
     float
         estimated value for cost_ref in 2020
     """
+    from scipy.optimize import curve_fit
+
     # print(df.lvl)
     try:
         pars = curve_fit(exponential, df.year, df.lvl, maxfev=5000)[0]
@@ -5,6 +5,7 @@ from collections.abc import Mapping, MutableMapping
 from copy import copy
 from functools import cache
 from itertools import product
+from typing import Optional
 
 import click
 import pandas as pd
@@ -216,6 +217,32 @@ def generate_set_elements(data: MutableMapping, name) -> None:
         data[name]["indexers"] = indexers
 
 
+#: Expression matching a units annotation that is already a code snippet, such as
+#: ``registry.Unit("kg")``, with either double or single quotes.
+_UNITS_EXPR = re.compile(r"""registry\.Unit\((["'])(.*)\1\)""")
+
+
+@cache
+def _units_expr(text: str) -> Optional[str]:
+    """Return a code snippet for :func:`.eval_anno` that gives the units in `text`.
+
+    `text` may be either a units expression, or a snippet already returned by this
+    function. :data:`None` is returned if the units cannot be parsed by the
+    :mod:`pint` application registry.
+    """
+    # Strip an existing wrapper, in case the annotation is already processed
+    if match := _UNITS_EXPR.fullmatch(text):
+        text = match.group(2)
+
+    # Check that the unit can be parsed by the pint.UnitRegistry
+    try:
+        registry.Unit(text)
+    except Exception:
+        return None
+    else:
+        return f'registry.Unit("{text}")'
+
+
 def process_units_anno(set_name: str, code: Code, quiet: bool = False) -> None:
     """Process an annotation on `code` with id="units".
 
@@ -246,18 +273,7 @@ def process_units_anno(set_name: str, code: Code, quiet: bool = False) -> None:
         log.log(level, f"{set_name.title()} {code} lacks defined units")
         return
 
-    # First try the expression as-is, in case already processed
-    expr = None
-    for candidate in (str(units_anno.text), f'registry.Unit("{units_anno.text}")'):
-        # Check that the unit can be parsed by the pint.UnitRegistry
-        try:
-            result = eval(candidate)
-        except Exception:
-            continue
-        else:
-            if isinstance(result, registry.Unit):
-                expr = candidate
-                break
+    expr = _units_expr(str(units_anno.text))
 
     if not expr:  # pragma: no cover
         # No coverage: code that triggers this exception should never be committed
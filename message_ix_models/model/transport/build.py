@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Any, Optional
 
 import genno
 import pandas as pd
-from genno import Computer, KeyExistsError, quote
+from genno import Computer, quote
 from message_ix import Scenario
 
 from message_ix_models import Context, ScenarioInfo
@@ -30,7 +30,11 @@ log = logging.getLogger(__name__)
 
 
 def add_debug(c: Computer) -> None:
-    """Add tasks for debugging the build."""
+    """Add tasks for debugging the build.
+
+    The key ``transport build debug`` computes all the outputs. It is included in
+    ``add transport data`` only if :attr:`.Config.debug_build` is :any:`True`.
+    """
     from genno import Key, KeySeq
 
     from .key import gdp_cap, ms, pdt_nyt
@@ -103,8 +107,9 @@ def add_debug(c: Computer) -> None:
     )
     # log.info(c.describe("transport build debug"))
 
-    # Also generate these debugging outputs when building the scenario
-    c.graph["add transport data"].append("transport build debug")
+    # Also generate these debugging outputs when building the scenario, if configured
+    if config.debug_build:
+        c.graph["add transport data"].append("transport build debug")
 
 
 def debug_multi(context: Context, *paths: Path) -> None:
@@ -385,11 +390,10 @@ def add_structure(c: Computer) -> None:
         (key.y, "model_periods", "y", "cat_year"),
         ("y0", itemgetter(0), "y::model"),
     ):
-        try:
-            c.add(*task, strict=True)
-        except KeyExistsError:  # Already present
+        if task[0] in c.graph:  # Already present
             # log.debug(f"Use existing {c.describe(task[0])}")
-            pass
+            continue
+        c.add(*task, strict=True)
 
     # Assemble a queue of tasks
     # - `Static` tasks
@@ -112,6 +112,11 @@ class Config(ConfigHelper):
     #: Sources for input data.
     data_source: DataSourceConfig = field(default_factory=DataSourceConfig)
 
+    #: If :any:`True`, compute the debugging outputs prepared by :func:`.add_debug`—CSV
+    #: files and plots—every time the model is built. These outputs can always be
+    #: generated separately with a dry run of :func:`.transport.build.main`.
+    debug_build: bool = False
+
     #: Set of modes handled by demand projection. This list must correspond to groups
     #: specified in the corresponding technology.yaml file.
     #:
@@ -84,9 +84,13 @@ def conversion(
             **common,
         )
         for par, df in i_o.items():
-            data0[par].append(df.pipe(broadcast, node_loc=nodes).pipe(same_node))
+            data0[par].append(df)
 
-    data1 = {par: pd.concat(dfs) for par, dfs in data0.items()}
+    # Broadcast across nodes once per parameter, rather than once per service
+    data1 = {
+        par: pd.concat(dfs).pipe(broadcast, node_loc=nodes).pipe(same_node)
+        for par, dfs in data0.items()
+    }
 
     data1.update(
         make_matched_dfs(
@@ -252,7 +256,7 @@ class IEA_Future_of_Trucks(ExoDataSource):
         self.path = package_data_path("transport", f"iea-2017-t4-{self.measure}.csv")
 
     def __call__(self):
-        from genno.operator import load_file
+        from .files import load_file
 
         return load_file(self.path, dims=rename_dims())
 
@@ -358,7 +362,7 @@ class MaybeAdaptR11Source(ExoDataSource):
                 raise NotImplementedError
 
     def __call__(self):
-        from genno.operator import load_file
+        from .files import load_file
 
         return load_file(self.path, dims=self.dims, name=self.measure)
 
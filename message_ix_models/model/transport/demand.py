@@ -11,7 +11,6 @@ from genno import Computer, KeySeq
 from message_ix import make_df
 
 from message_ix_models.report.key import GDP
-from message_ix_models.util import broadcast
 
 from . import files as exo
 from .key import (
@@ -60,24 +59,31 @@ def dummy(
         # No dummy data → return nothing
         return dict()
 
-    common = dict(level="useful", time="year", value=10 + np.arange(len(y)), year=y)
-
-    dfs = []
-
+    # IDs of demand commodities
+    ids = []
     for commodity in commodities:
         try:
             commodity.get_annotation(id="demand")
         except (AttributeError, KeyError):
             continue  # Not a demand commodity
 
-        unit = "t km" if "freight" in commodity.id else "km"
-        dfs.append(make_df("demand", commodity=commodity.id, unit=unit, **common))
+        ids.append(commodity.id)
+
+    # All combinations of (commodity, year, node), constructed at once
+    C, Y, N = len(ids), len(y), len(nodes)
+    dims = ["commodity", "year", "node"]
+    df = pd.MultiIndex.from_product([ids, y, nodes], names=dims).to_frame(index=False)
+    unit = np.repeat(["t km" if "freight" in id_ else "km" for id_ in ids], Y * N)
+    value = np.tile(np.repeat(10 + np.arange(Y), N), C)
 
     # # Dummy demand for light oil
-    # common["level"] = "final"
-    # dfs.append(make_df("demand", commodity="lightoil", **common))
+    # dfs.append(make_df("demand", commodity="lightoil", level="final", …))
 
-    return dict(demand=pd.concat(dfs).pipe(broadcast, node=nodes))
+    return dict(
+        demand=make_df(
+            "demand", **df, level="useful", time="year", unit=unit, value=value
+        )
+    )
 
 
 # Common keyword args to as_message_df()
@@ -4,7 +4,7 @@ See :ref:`transport-data-files` for documentation of the data flows in :data:`FI
 """
 
 import logging
-from functools import lru_cache
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional, Union, cast
 
@@ -24,6 +24,7 @@ if TYPE_CHECKING:
     from sdmx.model.common import ConceptScheme
 
     from message_ix_models import Context
+    from message_ix_models.types import AnyQuantity
 from message_ix_models.types import MaintainableArtefactArgs
 
 log = logging.getLogger(__name__)
@@ -32,6 +33,9 @@ log = logging.getLogger(__name__)
 #: List of all :class:`.ExogenousDataFile`.
 FILES: list["ExogenousDataFile"] = []
 
+#: Index of entries in :data:`FILES` by :attr:`.ExogenousDataFile.key`.
+_INDEX: dict[Key, int] = {}
+
 
 class ExogenousDataFile:
     """Exogenous/input data for MESSAGEix-Transport expected in a file.
@@ -210,7 +214,11 @@ class ExogenousDataFile:
         values = set(dims.values())
         dims.update({d: d for d in self.key.dims if d not in values})
 
-        c.add("load_file", path, key=self.key, dims=dims, name=self.key.name)
+        c.add(
+            self.key,
+            partial(load_file, path, dims=dims, name=self.key.name),
+            strict=True,
+        )
         return (self.key,)
 
     def generate_csv_template(self) -> Path:
@@ -242,9 +250,10 @@ def add(*, replace: bool = False, **kwargs) -> "Key":
         be available.
     """
     edf = ExogenousDataFile(**kwargs)
+    key = edf.key
 
-    if duplicate := list(filter(lambda x: x[1].key == edf.key, enumerate(FILES))):
-        i, existing = duplicate[0]
+    if (i := _INDEX.get(key)) is not None:
+        existing = FILES[i]
         if replace:
             log.info(f"Replace existing entry for {existing.key} at index {i}")
             FILES[i] = edf
@@ -252,9 +261,37 @@ def add(*, replace: bool = False, **kwargs) -> "Key":
             raise RuntimeError(f"Definition of {edf} duplicates existing {existing}")
     else:
         # Add to the list of FILES
+        _INDEX[key] = len(FILES)
         FILES.append(edf)
 
-    return edf.key
+    return key
+
+
+@lru_cache
+def _load_file(
+    path: Path,
+    stamp: tuple[int, int],
+    dims: tuple[tuple[str, str], ...],
+    name: Optional[str],
+) -> "AnyQuantity":
+    from genno.operator import load_file
+
+    return load_file(path, dims=dict(dims), name=name)
+
+
+def load_file(
+    path: Path, dims: dict[str, str], name: Optional[str] = None
+) -> "AnyQuantity":
+    """Load data from the file at `path`, like :func:`genno.operator.load_file`.
+
+    The parsed data are kept in memory, so that repeated builds in the same process do
+    not parse the same file again; a copy is returned on each call. The modification
+    time and size of the file are part of the cache key, so the file is read again if
+    it changes.
+    """
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    return _load_file(path, stamp, tuple(dims.items()), name).copy()
 
 
 @lru_cache()
@@ -1,7 +1,7 @@
 """Prepare non-LDV data from the IKARUS model via :file:`GEAM_TRP_techinput.xlsx`."""
 
 import logging
-from functools import lru_cache, partial
+from functools import partial
 from operator import le
 from typing import TYPE_CHECKING
 
@@ -125,21 +125,28 @@ def make_output(input_data: dict[str, pd.DataFrame], techs) -> "ParameterData":
         input_data["input"], output=registry.Quantity(1.0, UNITS["output"])
     )
 
-    @lru_cache
-    def c_for(t: str) -> str:
-        """Return e.g. "transport vehicle rail" for a specific rail technology `t`."""
-        return f"transport vehicle {techs[techs.index(t)].parent.id.lower()}"
+    # Mapping from each technology to its output commodity, e.g. "transport vehicle
+    # rail" for a specific rail technology. Built in one pass over `techs`, rather than
+    # searching the list for each technology.
+    commodity = {
+        t.id: f"transport vehicle {t.parent.id.lower()}" for t in techs if t.parent
+    }
 
     # - Set "commodity" and "level" labels.
     # - Set units.
     # - Fill "node_dest" and "time_dest".
     result["output"] = (
         result["output"]
-        .assign(commodity=lambda df: df["technology"].apply(c_for), level="useful")
+        .assign(commodity=lambda df: df["technology"].map(commodity), level="useful")
         .pipe(same_node)
         .pipe(same_time)
     )
 
+    # Technologies absent from `techs` or without a parent have no output commodity
+    df = result["output"]
+    if missing := set(df.loc[df["commodity"].isna(), "technology"]):
+        raise ValueError(f"No output commodity for technologies {sorted(missing)}")
+
     return result
 
 
@@ -220,13 +220,18 @@ def bound_activity_lo(c: Computer) -> list[Key]:
         # Extract MESSAGEix-Transport configuration
         cfg: "Config" = config["transport"]
 
+        # Look up the code for each mode once, outside the loop
+        mode_code = {
+            m: technologies[technologies.index(m)]
+            for m in ("2W", "BUS", "F ROAD", "RAIL")
+        }
+
         # Construct a set of all (node, technology, commodity) to constrain
         rows: list[list] = []
         cols = ["n", "t", "c", "value"]
         for (n, modes, c), value in cfg.minimum_activity.items():
             for m in ["2W", "BUS", "F ROAD"] if modes == "ROAD" else ["RAIL"]:
-                m_idx = technologies.index(m)
-                rows.extend([n, t, c, value] for t in techs_for(technologies[m_idx], c))
+                rows.extend([n, t, c, value] for t in techs_for(mode_code[m], c))
 
         # Assign y and value; convert to Quantity
         return Quantity(
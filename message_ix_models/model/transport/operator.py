@@ -1111,7 +1111,37 @@ def share_weight(
 
 
 def smooth(qty: "AnyQuantity") -> "AnyQuantity":
-    """Smooth `qty` (e.g. PRICE_COMMODITY) in the ``y`` dimension."""
+    """Smooth `qty` (e.g. PRICE_COMMODITY) in the ``y`` dimension.
+
+    The data are arranged in one 2-D array with ``y`` on the columns, and the weights
+    are applied to all rows at once. If `qty` has no other dimensions or any missing
+    values, :func:`_smooth` is used instead.
+    """
+    if set(qty.dims) == {"y"}:
+        return _smooth(qty)
+
+    wide = qty.to_series().unstack("y")
+    if wide.isna().any(axis=None):
+        return _smooth(qty)
+
+    a = wide.to_numpy()
+    result = np.empty_like(a)
+
+    # General smoothing
+    result[:, 1:-1] = 0.25 * a[:, :-2] + 0.5 * a[:, 1:-1] + 0.25 * a[:, 2:]
+    # First period
+    result[:, 0] = a[:, :3] @ [0.4, 0.4, 0.2]
+    # Final period. See _smooth()
+    result[:, -1] = a[:, -3:] @ [0.2, 0.2, 0.6]
+
+    return type(qty)(
+        pd.DataFrame(result, index=wide.index, columns=wide.columns).stack(),
+        units=qty.units,
+    )
+
+
+def _smooth(qty: "AnyQuantity") -> "AnyQuantity":
+    """Smooth `qty` in the ``y`` dimension using :mod:`genno` operations."""
     from genno.operator import add, concat
 
     # General smoothing
@@ -1,7 +1,7 @@
 """Reporting/postprocessing for MESSAGEix-Transport."""
 
 import logging
-from copy import deepcopy
+from copy import copy
 from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -20,6 +20,7 @@ from .key import pdt_nyt
 
 if TYPE_CHECKING:
     import ixmp
+    import pyam
     from genno import Computer
 
     from message_ix_models import Spec
@@ -48,19 +49,19 @@ CONVERT_IAMC = (
     dict(
         variable="transport activity",
         base="out:nl-t-ya-c:transport+units",
-        var=["Energy Service|Transportation", "t", "c"],
+        var=("Energy Service|Transportation", "t", "c"),
         sums=["c", "t", "c-t"],
     ),
     dict(
         variable="transport stock",
         base="CAP:nl-t-ya:ldv+units",
-        var=["Transport|Stock|Road|Passenger|LDV", "t"],
+        var=("Transport|Stock|Road|Passenger|LDV", "t"),
         unit="Mvehicle",
     ),
     dict(
         variable="transport sales",
         base="CAP_NEW:nl-t-yv:ldv+units",
-        var=["Transport|Sales|Road|Passenger|LDV", "t"],
+        var=("Transport|Sales|Road|Passenger|LDV", "t"),
         unit="Mvehicle",
     ),
     # Final energy
@@ -70,14 +71,14 @@ CONVERT_IAMC = (
     dict(
         variable="transport fe",
         base="in:nl-t-ya-c:transport+units",
-        var=["Final Energy|Transportation", "t", "c"],
+        var=("Final Energy|Transportation", "t", "c"),
         sums=["c", "t", "c-t"],
         unit=_FE_UNIT,
     ),
     dict(
         variable="transport fe ldv",
         base="in:nl-t-ya-c:ldv+units",
-        var=["Final Energy|Transportation|Road|Passenger|LDV", "t", "c"],
+        var=("Final Energy|Transportation|Road|Passenger|LDV", "t", "c"),
         unit="EJ/yr",
     ),
     # Emissions using MESSAGEix emission_factor parameter
@@ -111,9 +112,34 @@ CONVERT_IAMC = (
 )
 
 
+#: (key, operation, units) for :func:`reapply_units`. "apply" or "assign" selects
+#: :func:`.apply_units` or :func:`.assign_units`, respectively.
+# TODO Infer these values from technology.yaml etc.
+REAPPLY_UNITS = (
+    # Vehicle stocks
+    # FIXME should not need the extra [vehicle] in the numerator
+    ("CAP:nl-t-ya:non-ldv", "apply", "v**2 Tm / a"),
+    ("CAP:*:ldv", "apply", "Mv"),
+    ("CAP_NEW:*:ldv", "apply", "Mv"),
+    # NB these units are correct for final energy only
+    ("in:*:transport", "apply", "GWa / a"),
+    ("in:*:ldv", "apply", "GWa / a"),
+    ("out:*:transport", "apply", "Tm / a"),
+    ("out:*:ldv", "apply", "Tm / a"),
+    # Units of ACT are not carried, so must correct here:
+    # - Add [time]: -1
+    # - Remove [vehicle]: -1, [distance]: -1
+    #
+    # When run together with global.yaml reporting, emi:* is assigned units of
+    # "Mt / year". Using apply_units() causes these to be *converted* to  kt/a, i.e.
+    # increasing the magnitude; so use assign_units() instead.
+    ("emi:*:transport", "assign", "kt / a"),
+)
+
+
 #: Quantities in which to select transport technologies only. See
 #: :func:`select_transport_techs`.
-SELECT = [
+SELECT = (
     "CAP_NEW",
     "CAP",
     "fix_cost",
@@ -123,7 +149,30 @@ SELECT = [
     "inv_cost",
     "out",
     "var_cost",
-]
+)
+
+
+def write_csv(data: "pyam.IamDataFrame", path: Path) -> None:
+    """Write `data` to CSV at `path` using :mod:`pyarrow`.
+
+    The columns are the same as from :meth:`pyam.IamDataFrame.to_csv`, but
+    :func:`pyarrow.csv.write_csv` formats and encodes rows in batches instead of
+    row-by-row. String values are quoted. Objects other than
+    :class:`pyam.IamDataFrame` are passed to :func:`genno.operator.write_report`.
+    """
+    import pyam
+    import pyarrow
+    import pyarrow.csv
+    from genno.operator import write_report
+
+    if not isinstance(data, pyam.IamDataFrame) or data.empty:
+        return write_report(data, path)
+
+    df = data.timeseries().reset_index()
+    df.columns = [str(c).title() for c in df.columns]
+    pyarrow.csv.write_csv(
+        pyarrow.Table.from_pandas(df, preserve_index=False), str(path)
+    )
 
 
 # TODO Type c as (string) "Computer" once genno supports this
@@ -132,26 +181,24 @@ def add_iamc_store_write(c: Computer, base_key) -> "Key":
 
     If `base_key` is, for instance, "foo::iamc", this function adds the following keys:
 
-    - "foo::iamc+all": both of:
-
-      - "foo::iamc+file": both of:
-
-        - "foo::iamc+csv": write the data in `base_key` to a file named :file:`foo.csv`.
-        - "foo::iamc+xlsx": write the data in `base_key` to a file named
-          :file:`foo.xlsx`.
-
-        The files are created in a subdirectory using :func:`make_output_path`—that is,
-        including a path component given by the scenario URL.
+    - "foo::iamc+all": all of:
 
+      - "foo::iamc+file": same as "foo::iamc+csv", which writes the data in `base_key`
+        to a file named :file:`foo.csv`.
+      - "foo::iamc+xlsx": write the data in `base_key` to a file named
+        :file:`foo.xlsx`. Writing XLSX is much slower than CSV, so this key is not
+        included in "foo::iamc+file".
       - "foo::iamc+store" store the data in `base_key` as time series data on the
         scenario identified by the key "scenario".
 
+    The files are created in a subdirectory using :func:`make_output_path`—that is,
+    including a path component given by the scenario URL.
+
     .. todo:: Move upstream, to :mod:`message_ix_models`.
     """
     k = KeySeq(base_key)
 
-    file_keys = []
-    for suffix in ("csv", "xlsx"):
+    for suffix, func in (("csv", write_csv), ("xlsx", "write_report")):
         # Create the path
         path = c.add(
             k[f"{suffix} path"],
@@ -160,16 +207,16 @@ def add_iamc_store_write(c: Computer, base_key) -> "Key":
             name=f"{k.base.name}.{suffix}",
         )
         # Write `key` to the path
-        file_keys.append(c.add(k[suffix], "write_report", base_key, path))
+        c.add(k[suffix], func, base_key, path)
 
-    # Write all files
-    c.add(k["file"], file_keys)
+    # Write files. XLSX is only written if k["xlsx"] or k["all"] is requested.
+    c.add(k["file"], [k["csv"]])
 
     # Store data on "scenario"
     c.add(k["store"], "store_ts", "scenario", base_key)
 
-    # Both write and store
-    return single_key(c.add(k["all"], [k["file"], k["store"]]))
+    # Write both files and store
+    return single_key(c.add(k["all"], [k["file"], k["xlsx"], k["store"]]))
 
 
 def aggregate(c: "Computer") -> None:
@@ -227,7 +274,7 @@ def callback(rep: Reporter, context: Context) -> None:
         # Plain "transport" from the base model, for e.g. prices
         t_filter = {"transport"}
         # MESSAGEix-Transport -specific technologies
-        t_filter.update(map(str, rep.get("t::transport").copy()))
+        t_filter.update(map(str, rep.get("t::transport")))
         # # Required commodities (e.g. fuel) from the base model
         # t_filter.update(spec.require.set["commodity"])
 
@@ -333,7 +380,8 @@ def convert_iamc(c: "Computer") -> None:
 
     keys = []
     for info in CONVERT_IAMC:
-        handle_iamc(c, deepcopy(info))
+        # handle_iamc() modifies `info` and its list/dict values, but not their contents
+        handle_iamc(c, {k: copy(v) for k, v in info.items()})
         keys.append(f"{info['variable']}::iamc")
 
     # Concatenate IAMC-format tables
@@ -399,17 +447,23 @@ def latest_reporting_from_file(
 
         If no data is found, all the elements are :any:`None`.
     """
-    dirs = sorted(base_dir.glob(info.path.replace("vNone", "v*")), reverse=True)
-    for _dir in dirs:
+    # Sort matching directories by version number, newest first
+    dirs = []
+    for _dir in base_dir.glob(info.path.replace("vNone", "v*")):
+        try:
+            dirs.append((int(_dir.name.split("v")[-1]), _dir))
+        except ValueError:
+            continue  # Not a version number, e.g. "v1_old"
+
+    for path_version, _dir in sorted(dirs, reverse=True):
         path = _dir.joinpath("transport.csv")
         if not path.exists():
             log.info(f"Skip {_dir}; no file 'transport.csv'")
             continue
-        path_version = int(path.parent.name.split("v")[-1])
         return (
             path,
             path_version,
-            pd.read_csv(path).assign(
+            pd.read_csv(path, engine="pyarrow").assign(
                 Scenario=lambda df: df.Scenario + f"#{path_version}"
             ),
         )
@@ -438,31 +492,28 @@ def latest_reporting_from_platform(
     """
     from message_ix import Scenario
 
-    for _, row in (
-        platform.scenario_list(model=info.model, scen=info.scenario, default=False)
-        .sort_values(["version"], ascending=False)
-        .iterrows()
-    ):
-        if row.version <= minimum_version:
-            log.info(f"{row.version} ≤ minimum {minimum_version}")
-            break
-        elif row.is_locked:
-            log.info(f"Skip {info.url} {row.version}; locked")
-            continue
+    # Select candidate versions before loading any Scenario objects
+    sl = platform.scenario_list(model=info.model, scen=info.scenario, default=False)
+    sl = sl[sl.version > minimum_version]
+    # JDBCBackend may give raw Java values with object dtype, for which ~ is not "not"
+    locked = sl.is_locked.astype(bool)
+    if locked.any():
+        log.info(f"Skip {info.url} {sorted(sl.version[locked].tolist())}; locked")
 
+    for version in sorted(sl.version[~locked].tolist(), reverse=True):
         s = Scenario(
-            platform, model=info.model, scenario=info.scenario, version=row.version
+            platform, model=info.model, scenario=info.scenario, version=version
         )
         if s.has_solution():
             return (
                 s,
-                row.version,
+                version,
                 s.timeseries().assign(
-                    # Scenario=lambda df: df.Scenario + f"v{row.version}"
+                    # Scenario=lambda df: df.Scenario + f"v{version}"
                 ),
             )
         else:
-            log.info(f"Skip {info.url} {row.version}; no reporting output")
+            log.info(f"Skip {info.url} {version}; no reporting output")
             del s
 
     return None, -1, pd.DataFrame()
@@ -487,7 +538,7 @@ def misc(c: "Computer") -> None:
     c.add("distance:nl:non-ldv", "distance_nonldv", "config")
 
     # Demand per capita
-    c.add("demand::capita", "divdemand:n-c-y", "population:n-y")
+    c.add("demand::capita", "div", "demand:n-c-y", "population:n-y")
 
     # Adjustment factor for LDV calibration: fuel economy ratio
     k_num = Key("in:nl-t-ya-c:transport+units") / "c"  # As in CONVERT_IAMC
@@ -534,7 +585,10 @@ def multi(context: Context, targets):
     dfs = []
     for target in map(ScenarioInfo.from_url, targets):
         path, path_version, df_path = latest_reporting_from_file(target, report_dir)
-        scen, scen_version, df_scen = latest_reporting_from_platform(target, platform)
+        # Only versions newer than the file output can be used
+        scen, scen_version, df_scen = latest_reporting_from_platform(
+            target, platform, minimum_version=path_version
+        )
 
         if path_version == scen_version == -1:
             raise RuntimeError(f"No reporting output available for {target}")
@@ -551,18 +605,21 @@ def multi(context: Context, targets):
 
         dfs.append(df)
 
-    # Convert to a genno.Quantity
-    cols = ["Variable", "Model", "Scenario", "Region", "Unit"]
-    data = genno.Quantity(
-        pd.concat(dfs)
-        .sort_values(cols)
-        .melt(id_vars=cols, var_name="y")
-        .astype({"y": int})
+    # Convert to a genno.Quantity. Index the wide data, then stack the year columns:
+    # this avoids melting to long format and then indexing every row.
+    cols = ["Variable", "Scenario", "Region", "Unit"]
+    s = (
+        pd.concat(dfs, ignore_index=True)
         .pipe(_drop_unique, columns="Model", record=dict())
-        .rename(columns={"Variable": "v", "Scenario": "s", "Region": "n"})
-        .dropna(subset=["value"])
-        .set_index("v s n y Unit".split())["value"]
+        .set_index(cols)
+        .rename(columns=int)
+        .sort_index()
+        .rename_axis(index=["v", "s", "n", "Unit"], columns="y")
+        .stack()
+        .dropna()
+        .rename("value")
     )
+    data = genno.Quantity(s.reorder_levels("v s n y Unit".split()))
 
     # Select a subset of data
     qty = quantity_from_iamc(data, r"Transport\|Stock\|Road\|Passenger\|LDV\|(.*)")
@@ -590,29 +647,9 @@ def reapply_units(c: "Computer") -> None:
     inconsistent units.
 
     Here, add tasks to reapply units to selected subsets of data that are guaranteed to
-    have certain units.
+    have certain units, per :data:`REAPPLY_UNITS`.
     """
-    # TODO Infer these values from technology.yaml etc.
-    for base, (op, units) in {
-        # Vehicle stocks
-        # FIXME should not need the extra [vehicle] in the numerator
-        "CAP:nl-t-ya:non-ldv": ("apply", "v**2 Tm / a"),
-        "CAP:*:ldv": ("apply", "Mv"),
-        "CAP_NEW:*:ldv": ("apply", "Mv"),
-        # NB these units are correct for final energy only
-        "in:*:transport": ("apply", "GWa / a"),
-        "in:*:ldv": ("apply", "GWa / a"),
-        "out:*:transport": ("apply", "Tm / a"),
-        "out:*:ldv": ("apply", "Tm / a"),
-        # Units of ACT are not carried, so must correct here:
-        # - Add [time]: -1
-        # - Remove [vehicle]: -1, [distance]: -1
-        #
-        # When run together with global.yaml reporting, emi:* is assigned units of
-        # "Mt / year". Using apply_units() causes these to be *converted* to  kt/a, i.e.
-        # increasing the magnitude; so use assign_units() instead.
-        "emi:*:transport": ("assign", "kt / a"),
-    }.items():
+    for base, op, units in REAPPLY_UNITS:
         key = c.infer_keys(base)
         c.add(key + "units", f"{op}_units", key, units=units, sums=True)
 
@@ -2,6 +2,7 @@
 
 import logging
 from collections.abc import Hashable, Iterable, Sequence
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Union
 
@@ -41,6 +42,13 @@ def path_fallback(context_or_regions: Union[Context, str], *parts) -> Path:
         # Use a value from a Context object, or a default
         regions = context_or_regions.model.regions
 
+    return _path_fallback(regions, *parts)
+
+
+@lru_cache
+def _path_fallback(regions: str, *parts) -> Path:
+    # Package data files do not change during a session, so results are cached;
+    # FileNotFoundError is not, so a file added later is still found
     candidates = (
         package_data_path("transport", regions, *parts),
         package_data_path("transport", *parts),
@@ -22,12 +22,22 @@ ComputerT = TypeVar("ComputerT", bound="genno.Computer")
 Callback = Callable[[ComputerT, "Context"], None]
 
 
-def _default_callbacks() -> list[Callback]:
+def _plot_callback(c: "genno.Computer", context: "Context") -> None:
+    """Call :func:`.report.plot.callback`.
+
+    :mod:`.report.plot` imports :mod:`plotnine` and :mod:`matplotlib`, so it is only
+    imported when a Reporter is actually prepared, not when a :class:`.Context` is
+    created.
+    """
     from message_ix_models.report import plot
 
+    plot.callback(c, context)
+
+
+def _default_callbacks() -> list[Callback]:
     from . import defaults
 
-    return [defaults, plot.callback]
+    return [defaults, _plot_callback]
 
 
 @dataclass
@@ -21,7 +21,7 @@ if TYPE_CHECKING:
     from pathlib import Path
 
     from genno import Computer, Key
-    from genno.types import AnyQuantity, TQuantity
+    from genno.types import AnyQuantity, InterpOptions, TQuantity
     from sdmx.model.v21 import Code
 
 log = logging.getLogger(__name__)
@@ -35,6 +35,7 @@ __all__ = [
     "from_url",
     "get_ts",
     "gwp_factors",
+    "interpolate_batch",
     "make_output_path",
     "model_periods",
     "nodes_ex_world",
@@ -164,6 +165,47 @@ def gwp_factors() -> "AnyQuantity":
     )
 
 
+def interpolate_batch(
+    qty: "TQuantity",
+    coords: Mapping[Hashable, Any],
+    method: "InterpOptions" = "linear",
+    kwargs: Optional[Mapping[str, Any]] = None,
+) -> "TQuantity":
+    """Interpolate `qty` along one dimension, for all other labels at once.
+
+    Like :func:`genno.operator.interpolate`, but for :class:`.AttrSeries` that function
+    calls :func:`scipy.interpolate.interp1d` once for every combination of labels on
+    the other dimensions. This function arranges the data in one 2-D array and calls
+    :func:`~scipy.interpolate.interp1d` once.
+
+    If `qty` has only the one dimension, or any combination of labels on the other
+    dimensions has missing values along it, :func:`genno.operator.interpolate` is used
+    instead.
+    """
+    from scipy.interpolate import interp1d
+
+    if len(coords) != 1:
+        raise NotImplementedError("interpolate_batch() on more than 1 dimension")
+
+    dim, levels = next(iter(coords.items()))
+    if set(qty.dims) == {dim}:
+        # Only one call to interp1d() in any case
+        return genno.operator.interpolate(qty, coords, method, kwargs=kwargs)
+
+    # Arrange as 2-D: other dimensions on the rows, `dim` on the columns
+    wide = qty.to_series().unstack(dim)
+    if wide.isna().any(axis=None):
+        return genno.operator.interpolate(qty, coords, method, kwargs=kwargs)
+
+    func = interp1d(wide.columns, wide.to_numpy(), kind=method, axis=1, **kwargs or {})
+    result = (
+        pd.DataFrame(func(levels), index=wide.index, columns=pd.Index(levels, name=dim))
+        .stack()
+        .reorder_levels(qty.dims)
+    )
+    return type(qty)(result, name=qty.name, units=qty.units)
+
+
 def make_output_path(config: Mapping, name: Union[str, "Path"]) -> "Path":
     """Return a path under the "output_dir" Path from the reporter configuration."""
     return config["output_dir"].joinpath(name)
@@ -1,3 +1,4 @@
+import logging
 import re
 from collections import defaultdict
 from copy import deepcopy
@@ -272,7 +273,7 @@ def test_generate_set_elements(colour_expr, expected):
     assert expected == set(map(str, data["technology"]["add"]))
 
 
-def test_process_units_anno():
+def test_process_units_anno(caplog):
     # Prepare 2 codes: the parent has a units annotation, the child has none
     codes = as_codes({"foo": {"units": "kg"}, "bar": {"parent": "foo"}})
 
@@ -282,3 +283,18 @@ def test_process_units_anno():
     assert registry.Unit("kg") == codes[1].eval_annotation(
         "units", dict(registry=registry)
     )
+
+    # Annotation text that is already a code snippet, with either quote style, is
+    # accepted and propagated without a warning
+    for text, expected in (
+        ('registry.Unit("kg")', "kg"),
+        ("registry.Unit('passenger / vehicle')", "passenger / vehicle"),
+    ):
+        codes = as_codes({"foo": {"units": text}, "bar": {"parent": "foo"}})
+        with caplog.at_level(logging.WARNING):
+            process_units_anno("", codes[0])
+        assert not caplog.messages
+        for code in codes:
+            assert registry.Unit(expected) == code.eval_annotation(
+                "units", dict(registry=registry)
+            )
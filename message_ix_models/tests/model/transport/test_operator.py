@@ -10,12 +10,14 @@ from packaging.version import parse
 
 from message_ix_models.model.transport import Config, factor
 from message_ix_models.model.transport.operator import (
+    _smooth,
     broadcast_advance,
     distance_ldv,
     distance_nonldv,
     factor_input,
     factor_ssp,
     sales_fraction_annual,
+    smooth,
     transport_check,
     uniform_in_dim,
 )
@@ -163,6 +165,21 @@ def test_sales_fraction_annual():
     assert result.sel(n="B", y=2008).item() <= result.sel(n="B", y=2020).item()
 
 
+def test_smooth() -> None:
+    q = genno.Quantity(
+        [[1.0, 2.0, 4.0, 3.0, 5.0], [1.0, 1.0, 1.0, 1.0, 1.0]],
+        coords={"n": list("AB"), "y": [2020, 2025, 2030, 2035, 2040]},
+        units="USD / km",
+    )
+
+    result = smooth(q)
+
+    # Same results as from genno operations
+    assert_qty_equal(_smooth(q).transpose(*result.dims), result, check_attrs=False)
+    # Constant values are unchanged
+    npt.assert_allclose(1.0, result.sel(n="B"))
+
+
 @pytest.mark.xfail(reason="Incomplete test")
 def test_transport_check(test_context):
     s = Scenario(test_context.get_platform(), model="m", scenario="s", version="new")
@@ -1,13 +1,18 @@
 import logging
 from copy import deepcopy
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
+import pandas as pd
 import pytest
 from pytest import mark, param
 
 from message_ix_models import ScenarioInfo
 from message_ix_models.model.transport import build, key
-from message_ix_models.model.transport.report import configure_legacy_reporting
+from message_ix_models.model.transport.report import (
+    configure_legacy_reporting,
+    latest_reporting_from_platform,
+)
 from message_ix_models.model.transport.testing import (
     MARK,
     built_transport,
@@ -214,3 +219,74 @@ def test_iamc_simulated(
     } <= set(ts["variable"].unique())
 
     del result
+
+
+def test_misc_demand_capita() -> None:
+    """:func:`.report.misc` adds per-capita demand with the expected dimensions."""
+    from genno import Computer
+
+    from message_ix_models.model.transport import files as exo
+    from message_ix_models.model.transport.report import misc
+
+    c = Computer()
+    c.require_compat("message_ix_models.report.operator")
+    c.require_compat("message_ix_models.model.transport.operator")
+    info = ScenarioInfo()
+    info.y0 = 2020
+    c.add("config", dict(transport=SimpleNamespace(base_model_info=info)))
+    # Placeholders for the inputs to tasks added by misc()
+    for k in (
+        "ACT:nl-t-yv-va-m-h",
+        "demand:n-c-y",
+        "in:nl-t-ya-c:transport+units",
+        "out:nl-t-ya-c:transport+units",
+        "population:n-y",
+        "scenario",
+        exo.input_ref_ldv,
+    ):
+        c.add(k, None)
+
+    misc(c)
+
+    # Key used by .transport.plot is present, with dimensions of both operands
+    assert "demand:n-c-y:capita" in c
+    assert {"n", "c", "y"} == set(c.full_key("demand::capita").dims)
+
+
+def test_latest_reporting_from_platform(monkeypatch) -> None:
+    """:func:`.latest_reporting_from_platform` handles object-dtype ``is_locked``."""
+    import message_ix
+
+    class MockScenario:
+        def __init__(self, platform, model, scenario, version):
+            self.version = version
+
+        def has_solution(self):
+            return self.version != 4
+
+        def timeseries(self):
+            return pd.DataFrame(dict(version=[self.version]))
+
+    class MockPlatform:
+        def scenario_list(self, **kwargs):
+            # As returned by JDBCBackend: raw values with object dtype
+            return pd.DataFrame(
+                dict(
+                    version=[1, 2, 3, 4, 5],
+                    is_locked=pd.Series(
+                        [False, False, False, False, True], dtype=object
+                    ),
+                )
+            )
+
+    monkeypatch.setattr(message_ix, "Scenario", MockScenario)
+    info = ScenarioInfo(model="m", scenario="s")
+
+    # Version 5 is locked; version 4 has no solution; version 3 is returned
+    s, version, data = latest_reporting_from_platform(info, MockPlatform(), 1)
+    assert 3 == version == s.version
+    assert [3] == data["version"].tolist()
+
+    # No version above the cut-off with reporting output
+    s, version, data = latest_reporting_from_platform(info, MockPlatform(), 3)
+    assert (None, -1, True) == (s, version, data.empty)
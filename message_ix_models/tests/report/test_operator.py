@@ -7,6 +7,7 @@ import pandas.testing as pdt
 import pytest
 import xarray as xr
 from genno import Computer, Quantity
+from genno.operator import interpolate
 from ixmp.testing import assert_logs
 from message_ix.testing import make_dantzig
 
@@ -18,6 +19,7 @@ from message_ix_models.report.operator import (
     from_url,
     get_ts,
     gwp_factors,
+    interpolate_batch,
     make_output_path,
     model_periods,
     remove_ts,
@@ -136,6 +138,35 @@ def test_gwp_factors():
     assert ("gwp metric", "e", "e equivalent") == result.dims
 
 
+def test_interpolate_batch():
+    y = [2020, 2030, 2050]
+    qty = Quantity(
+        xr.DataArray(
+            [[1.0, 2.0, 4.0], [3.0, 3.0, 1.0]],
+            coords=(["x1", "x2"], y),
+            dims=("x", "y"),
+        ),
+        units="kg",
+    )
+    coords = dict(y=[2020, 2025, 2040, 2060])
+    kw = dict(fill_value="extrapolate")
+
+    # Function runs
+    result = interpolate_batch(qty, coords, kwargs=kw)
+
+    # Result is the same as from genno.operator.interpolate()
+    expected = interpolate(qty, coords, kwargs=kw)
+    assert qty.units == result.units
+    pdt.assert_series_equal(
+        expected.to_series().sort_index(), result.to_series().sort_index()
+    )
+
+    # Works with missing values, via the fallback
+    qty = Quantity(pd.Series(qty.to_series()).drop(("x1", 2030)), units="kg")
+    result = interpolate_batch(qty, coords, kwargs=kw)
+    assert 1.5 == result.sel(x="x1", y=2025).item()
+
+
 def test_make_output_path(tmp_path, c):
     # Configure a Computer, ensuring the output_dir configuration attribute is set
     c.configure(output_dir=tmp_path)
@@ -177,6 +177,38 @@ def test_convert_units(recwarn):
     assert N == len(recwarn)
 
 
+def test_convert_units_dataframe():
+    """:func:`.convert_units` works with :class:`pandas.DataFrame` and ScenarioInfo."""
+    from message_ix_models.model.structure import process_units_anno
+
+    info = ScenarioInfo()
+    for set_name, data in (
+        ("commodity", {"c": {"units": "GWa"}}),
+        ("technology", {"t0": {"units": "GWa"}, "t1": {"units": "kWa"}}),
+    ):
+        for code in as_codes(data):
+            process_units_anno(set_name, code)
+            info.set[set_name].append(code)
+
+    df = pd.DataFrame(
+        dict(
+            technology=["t1", "t0", "t1", None],
+            commodity="c",
+            unit="",
+            value=[1.0, 2.0, 3.0, 4.0],
+        ),
+        index=[3, 2, 1, 0],
+    )
+
+    result = convert_units(df, info=info)
+
+    # Rows with missing labels are discarded; others keep their original order
+    assert [3, 2, 1] == result.index.tolist()
+    # Values and units are converted only where the factor is not 1.0
+    assert ["GWa / kWa", "", "GWa / kWa"] == result["unit"].tolist()
+    assert np.allclose([1e-6, 2.0, 3e-6], result["value"])
+
+
 def test_copy_column():
     df = pd.DataFrame([[0, 1], [2, 3]], columns=["a", "b"])
     df = df.assign(c=copy_column("a"), d=4)
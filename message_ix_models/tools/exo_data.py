@@ -12,6 +12,7 @@ from genno.core.key import single_key
 
 from message_ix_models import ScenarioInfo
 from message_ix_models.model.structure import get_codes
+from message_ix_models.report.operator import interpolate_batch
 
 __all__ = [
     "MEASURES",
@@ -133,7 +134,7 @@ class ExoDataSource(ABC):
            :func:`.genno.operator.aggregate`) on the |n| dimension using the key
            "n::groups".
         2. If :attr:`.interpolate` is :any:`True`, interpolates the data (
-           :func:`.genno.operator.interpolate`) on the |y| dimension using "y::coords".
+           :func:`.interpolate_batch`) on the |y| dimension using "y::coords".
         """
         k = base_key
         # Aggregate
@@ -143,7 +144,7 @@ class ExoDataSource(ABC):
         # Interpolate to the desired set of periods
         if self.interpolate:
             kw = dict(fill_value="extrapolate")
-            k = single_key(c.add(k + "2", "interpolate", k, "y::coords", kwargs=kw))
+            k = single_key(c.add(k + "2", interpolate_batch, k, "y::coords", kwargs=kw))
 
         return k
 
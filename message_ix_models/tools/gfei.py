@@ -4,6 +4,7 @@ import logging
 from typing import TYPE_CHECKING
 
 import genno
+import genno.compat.plotnine
 import plotnine as p9
 
 from message_ix_models.tools.exo_data import ExoDataSource, register_source
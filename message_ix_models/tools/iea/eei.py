@@ -7,6 +7,7 @@ import re
 from typing import TYPE_CHECKING, Literal
 
 import genno
+import genno.compat.plotnine
 import numpy as np
 import pandas as pd
 import plotnine as p9
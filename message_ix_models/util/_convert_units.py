@@ -81,24 +81,38 @@ def _(data: pd.DataFrame, info: "ScenarioInfo") -> pd.DataFrame:
         log.debug(f"No unit conversion for data with columns {list(data.columns)}")
         return data
 
-    def _convert_group(df):
-        """Convert `df` in which (technology, level) are uniform."""
-        row = df.iloc[1, :]
-
-        factor = registry.Quantity(1.0, row["unit"])
+    # Discard rows with missing labels in any of `columns`, as groupby() would
+    data = data.dropna(subset=columns)
+
+    # Compute a conversion factor once for each distinct (technology, commodity, unit),
+    # rather than once per group of rows
+    factors = []
+    for t, c, u in data[columns].drop_duplicates().itertuples(index=False):
+        factor = registry.Quantity(1.0, u)
         try:
-            factor = factor.to(info.io_units(row["technology"], row["commodity"]))
+            converted = factor.to(info.io_units(t, c))
         except Exception as e:
             log.error(f"{type(e).__name__}: {e!s}")
+            converted = factor
+        factors.append((t, c, u, converted.magnitude, f"{converted.units:~}"))
+
+    # Align the factors with the rows of `data`; a left merge preserves the row order
+    f = (
+        data[columns]
+        .merge(
+            pd.DataFrame(factors, columns=columns + ["factor", "new_unit"]),
+            how="left",
+            on=columns,
+        )
+        .set_axis(data.index)
+    )
 
-        if factor.magnitude != 1.0:
-            return df.eval("value = value * @factor.magnitude").assign(
-                unit=f"{factor.units:~}"
-            )
-        else:
-            return df
-
-    return data.groupby(columns, group_keys=False)[data.columns].apply(_convert_group)
+    # Convert values and units of only the rows where the factor is not 1.0
+    keep = f["factor"].fillna(1.0) == 1.0
+    return data.assign(
+        value=data["value"].where(keep, data["value"] * f["factor"]),
+        unit=data["unit"].where(keep, f["new_unit"]),
+    )
 
 
 @convert_units.register(dict)
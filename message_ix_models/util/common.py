@@ -145,8 +145,12 @@ def _load(
     if path.suffix == ".yaml":
         import yaml
 
+        # Use the LibYAML-based loader, if available: several times faster than the
+        # pure-Python SafeLoader, with identical results
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
         with open(path, encoding="utf-8") as f:
-            var[key] = yaml.safe_load(f)
+            var[key] = yaml.load(f, Loader=loader)
     else:
         raise ValueError(path.suffix)
 
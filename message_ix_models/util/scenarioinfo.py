@@ -196,9 +196,19 @@ class ScenarioInfo:
     def update(self, other: "ScenarioInfo"):
         """Update with the set elements of `other`."""
         for name, data_list in other.set.items():
-            self.set[name].extend(
-                filter(lambda id: id not in self.set[name], data_list)
-            )
+            existing = self.set[name]
+            try:
+                # Check membership against a set, instead of scanning `existing` for
+                # every element of `data_list`
+                seen = set(existing)
+                new = []
+                for item in data_list:
+                    if item not in seen:
+                        seen.add(item)
+                        new.append(item)
+            except TypeError:  # Some element is not hashable
+                new = [i for i in data_list if i not in existing]
+            existing.extend(new)
 
         for name, data_frame in other.par.items():
             log.warning(f"Not implemented: merging parameter data for {name!r}")
@@ -2,6 +2,7 @@
 
 import logging
 import re
+from ast import literal_eval
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, fields
 from datetime import datetime
@@ -266,7 +267,7 @@ Each concept in the concept scheme has:
         )
         # Add `v` to the aliases annotation
         anno = concept.get_annotation(id="aliases")
-        anno.text = repr(eval(str(anno.text)) | {v})
+        anno.text = repr(literal_eval(str(anno.text)) | {v})
 
     for c_id in "MODEL", "SCENARIO", "VERSION":
         cs.setdefault(